@@ -1,8 +1,8 @@
-from flask import Flask, render_template, jsonify, request, session, abort, redirect, flash
+from flask import Flask, render_template, jsonify, request, session, abort, redirect, flash, make_response, url_for
 from flask_bcrypt import Bcrypt
 import time
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta
 from pubnub.pnconfiguration import PNConfiguration
 from pubnub.pubnub import PubNub
 from pubnub.callbacks import SubscribeCallback
@@ -10,6 +10,8 @@ from pubnub.enums import PNStatusCategory
 from dotenv import load_dotenv
 import os
 import sys
+import gzip
+import hashlib
 from functools import wraps
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -57,13 +59,20 @@ greenhouse_state = {
     "device_online": False
 }
 
+# bumped on every state change so cached pages know when they are stale
+state_version = 0
+
 # lock for thread-safe state updates
 state_lock = threading.Lock()
 
+# rendered dashboard pages keyed by (device, state version, role, username)
+dashboard_cache = {}
+dashboard_cache_lock = threading.Lock()
+
 class DataListener(SubscribeCallback):
     def message(self, pubnub, message):
         # handle incoming data
-        global greenhouse_state
+        global greenhouse_state, state_version
         
         msg_data = message.message
         
@@ -78,17 +87,26 @@ class DataListener(SubscribeCallback):
                 if "last_watered" in msg_data:
                     greenhouse_state["last_watered"] = msg_data["last_watered"]
                 
-                greenhouse_state["last_update"] = datetime.now().strftime("%H:%M:%S")
+                # show when the sensor was actually read, not when the message arrived
+                updated = datetime.now()
+                if msg_data.get("reading_age") is not None:
+                    updated -= timedelta(seconds=msg_data["reading_age"])
+                
+                greenhouse_state["last_update"] = updated.strftime("%H:%M:%S")
                 greenhouse_state["device_online"] = True
+                state_version += 1
     
     def status(self, pubnub, status):
         # handle connection changes
+        global state_version
+        
         if status.category == PNStatusCategory.PNConnectedCategory:
             print("Connected to PubNub - listening for sensor data")
         elif status.category == PNStatusCategory.PNConnectionError:
             print("PubNub connection error")
             with state_lock:
                 greenhouse_state["device_online"] = False
+                state_version += 1
 
 
 def start_listener():
@@ -112,6 +130,58 @@ def publish_command(command, params=None):
         return False
 
 
+# caching
+@app.template_global()
+def static_url(filename):
+    # static url with the file's modified time as a version, so edits get a new url
+    path = os.path.join(app.static_folder, filename)
+    version = int(os.path.getmtime(path))
+    return url_for("static", filename=filename, v=version)
+
+
+@app.after_request
+def cache_versioned_static(response):
+    # only versioned static urls are safe to keep for a year
+    if request.endpoint == "static" and "v" in request.args and response.status_code in (200, 304):
+        response.headers["Cache-Control"] = "public, max-age=31536000"
+    return response
+
+
+def get_cached_dashboard(username, is_user_admin):
+    # render the dashboard once per state change, then reuse the body and its gzip copy
+    with state_lock:
+        version = state_version
+        state = dict(greenhouse_state)
+    
+    key = (DEVICE_ID, version, is_user_admin, username)
+    
+    with dashboard_cache_lock:
+        entry = dashboard_cache.get(key)
+    if entry:
+        return entry
+    
+    body = render_template("dashboard.html",
+                           state=state,
+                           username=username,
+                           is_admin=is_user_admin).encode("utf-8")
+    entry = {
+        "body": body,
+        "gzip": gzip.compress(body),
+        "etag": hashlib.sha1(body).hexdigest()
+    }
+    
+    with dashboard_cache_lock:
+        # drop pages rendered from older state
+        for old_key in [k for k in dashboard_cache if k[1] < version]:
+            del dashboard_cache[old_key]
+        
+        # don't cache this page if the state changed while it was rendering
+        if version == state_version:
+            dashboard_cache[key] = entry
+    
+    return entry
+
+
 # authentication
 def login_is_required(function):
     @wraps(function)
@@ -213,11 +283,23 @@ def logout():
 @login_is_required
 def dashboard():
     # dashboard view (need to be logged in)
-    is_user_admin = is_admin(session["user_id"])
-    return render_template("dashboard.html", 
-                         state=greenhouse_state,
-                         username=session.get("name"),
-                         is_admin=is_user_admin)
+    is_user_admin = bool(is_admin(session["user_id"]))
+    entry = get_cached_dashboard(session.get("name"), is_user_admin)
+    
+    if request.accept_encodings["gzip"] > 0:
+        response = make_response(entry["gzip"])
+        response.headers["Content-Encoding"] = "gzip"
+        response.set_etag(entry["etag"] + "-gzip")
+    else:
+        response = make_response(entry["body"])
+        response.set_etag(entry["etag"])
+    
+    response.headers["Content-Type"] = "text/html; charset=utf-8"
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.vary.add("Accept-Encoding")
+    
+    # send 304 if the browser already has this version
+    return response.make_conditional(request)
 
 
 # API Routes
@@ -1,6 +1,7 @@
 import time
 import threading
 import os
+import random
 from gpiozero import LED, Servo
 import adafruit_dht
 import board
@@ -29,16 +30,27 @@ LED_PIN = 22
 SERVO_PIN = 18
 DHT_PIN = board.D4
 
-# update interval (30 minutes)
-UPDATE_INTERVAL = 1800
+# DHT22 can't be read more than once every 2 seconds
+SENSOR_READ_INTERVAL = 2
+
+# retry backoff for failed reads (seconds)
+SENSOR_RETRY_BASE_DELAY = 2
+SENSOR_RETRY_MAX_DELAY = 60
+
+# consecutive failed reads before the sensor is reported as failing
+SENSOR_FAILURE_WARN_THRESHOLD = 5
 
 # ==================== GLOBAL VARIABLES ====================
 pubnub_instance = None
 latest_temp = None
 latest_humidity = None
+latest_read_time = None
 led_status = False
 last_watered = None
 
+# lock for the cached sensor reading
+sensor_lock = threading.Lock()
+
 # ==================== PUBNUB FUNCTIONS ====================
 def init_pubnub(on_command_received):
     global pubnub_instance
@@ -84,7 +96,7 @@ def _handle_incoming_message(message_data, command_handler):
     command_handler(command, params)
 
 
-def publish_sensor_data(temperature, humidity, led_on=False, last_watered=None):    
+def publish_sensor_data(temperature, humidity, led_on=False, last_watered=None, reading_age=None):    
     global pubnub_instance
     
     if not pubnub_instance:
@@ -94,6 +106,7 @@ def publish_sensor_data(temperature, humidity, led_on=False, last_watered=None):
         'device': DEVICE_ID,
         'temperature': temperature,
         'humidity': humidity,
+        'reading_age': reading_age,
         'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
         'led_on': led_on,
         'last_watered': last_watered
@@ -152,31 +165,31 @@ dht22 = adafruit_dht.DHT22(DHT_PIN)
 
 # ==================== SENSOR FUNCTIONS ====================
 def read_sensors():
-    global latest_temp, latest_humidity
+    # read the DHT22 once, only called from the sensor reader thread
+    global latest_temp, latest_humidity, latest_read_time
     
-    try:
-        temperature = dht22.temperature
-        humidity = dht22.humidity
+    temperature = dht22.temperature
+    humidity = dht22.humidity
 
-        if temperature is not None and humidity is not None:
-            latest_temp = round(temperature, 1)
-            latest_humidity = round(humidity, 1)
-            
-            return True
-    except RuntimeError as e:
-        print(f"Sensor error: {e}")
-    except Exception as e:
-        print(f"Unexpected error: {e}")
+    if temperature is None or humidity is None:
+        return False
     
-    return False
+    with sensor_lock:
+        latest_temp = round(temperature, 1)
+        latest_humidity = round(humidity, 1)
+        latest_read_time = time.monotonic()
+    
+    return True
 
 
 def get_sensor_data():
-    # try to get fresh reading
-    if not read_sensors():
-        # if fresh reading fails, use last known values
-    
-    return latest_temp, latest_humidity
+    # return the last good reading and its age in seconds (never touches the hardware)
+    with sensor_lock:
+        if latest_read_time is None:
+            return latest_temp, latest_humidity, None
+        
+        age = round(time.monotonic() - latest_read_time, 1)
+        return latest_temp, latest_humidity, age
 
 
 # ==================== COMMAND HANDLER ====================
@@ -220,13 +233,14 @@ def handle_command(command, params):
     
     elif command in ['refresh', 'get_data', 'get_sensors', 'status']:
         # refresh and publish sensor data
-        temp, humidity = get_sensor_data()
+        temp, humidity, age = get_sensor_data()
         
         success = publish_sensor_data(
             temperature=temp,
             humidity=humidity,
             led_on=led_status,
-            last_watered=last_watered
+            last_watered=last_watered,
+            reading_age=age
         )
         
         if success:
@@ -239,12 +253,47 @@ def handle_command(command, params):
         publish_acknowledgment(command, False, f"Unknown command: {command}")
 
 
-# ==================== AUTO-UPDATE THREAD ====================
-def auto_update():
-    # updates sensor data at regular intervals
+# ==================== SENSOR READER THREAD ====================
+def _retry_delay(failures):
+    # exponential backoff with jitter, never faster than the sensor allows
+    delay = min(SENSOR_RETRY_MAX_DELAY, SENSOR_RETRY_BASE_DELAY * 2 ** (failures - 1))
+    return max(SENSOR_READ_INTERVAL, random.uniform(delay / 2, delay))
+
+
+def sensor_reader():
+    # owns the DHT22 - reads it as often as is safe and keeps the cache fresh
+    failures = 0
+    warned = False
+    unexpected_reported = False
+    
     while True:
-        read_sensors()
-        time.sleep(UPDATE_INTERVAL)
+        try:
+            success = read_sensors()
+            error = "incomplete reading"
+        except RuntimeError as e:
+            # checksum/timing errors are normal for the DHT22, only report long streaks
+            success = False
+            error = e
+        except Exception as e:
+            success = False
+            error = e
+            if not unexpected_reported:
+                print(f"Unexpected sensor error: {e}")
+                unexpected_reported = True
+        
+        if success:
+            if warned:
+                print(f"Sensor recovered after {failures} failed reads")
+            failures = 0
+            warned = False
+            unexpected_reported = False
+            time.sleep(SENSOR_READ_INTERVAL)
+        else:
+            failures += 1
+            if failures == SENSOR_FAILURE_WARN_THRESHOLD:
+                print(f"Sensor failing: {failures} reads in a row, last error: {error}")
+                warned = True
+            time.sleep(_retry_delay(failures))
 
 
 # ==================== MAIN ====================
@@ -252,9 +301,9 @@ if __name__ == "__main__":
     # initialize PubNub with our command handler
     init_pubnub(handle_command)
     
-    # start auto-update thread
-    update_thread = threading.Thread(target=auto_update, daemon=True)
-    update_thread.start()
+    # start sensor reader thread
+    reader_thread = threading.Thread(target=sensor_reader, daemon=True)
+    reader_thread.start()
     
     try:
         # keep the program running